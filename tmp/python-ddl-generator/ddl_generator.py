@@ -3,40 +3,52 @@ SQL建表语句生成器 - Python版本
 支持多数据库类型DDL生成
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 import re
+import string
+import sys
+
+# 建表语句右括号之后的固定内容
+INLINE_TABLE_SUFFIX = "\n COMMENT ''"
 
 # 数据库配置
-DATABASE_CONFIGS = {
+DATABASE_CONFIGS: Dict[str, Dict[str, Any]] = {
     'spark': {
         'create_table_prefix': 'CREATE TABLE IF NOT EXISTS',
         'comment_syntax': 'INLINE',
+        'table_suffix': INLINE_TABLE_SUFFIX,
     },
     'mysql': {
         'create_table_prefix': 'CREATE TABLE IF NOT EXISTS',
         'comment_syntax': 'INLINE',
         'add_primary_key': True,
-        'add_engine': True,
+        'table_suffix': "\n ENGINE=InnoDB" + INLINE_TABLE_SUFFIX,
     },
     'postgresql': {
         'create_table_prefix': 'CREATE TABLE',
         'comment_syntax': 'SEPARATE',
+        'table_suffix': "\n;\n\nCOMMENT ON TABLE 表名 IS '';",
     },
     'starrocks': {
         'create_table_prefix': 'CREATE TABLE IF NOT EXISTS',
         'comment_syntax': 'INLINE',
+        'table_suffix': INLINE_TABLE_SUFFIX,
     },
     'clickhouse': {
         'create_table_prefix': 'CREATE TABLE IF NOT EXISTS',
         'comment_syntax': 'INLINE',
+        'table_suffix': INLINE_TABLE_SUFFIX,
     },
     'hive': {
         'create_table_prefix': 'CREATE TABLE IF NOT EXISTS',
         'comment_syntax': 'INLINE',
+        'table_suffix': INLINE_TABLE_SUFFIX,
     },
     'doris': {
         'create_table_prefix': 'CREATE TABLE IF NOT EXISTS',
         'comment_syntax': 'INLINE',
+        'table_suffix': INLINE_TABLE_SUFFIX,
     },
 }
 
@@ -50,6 +62,40 @@ DATABASE_LABELS = {
     'doris': 'Doris',
 }
 
+SUPPORTED_DATABASES = frozenset(DATABASE_CONFIGS)
+
+# SELECT子句的结束关键字
+SELECT_TERMINATORS = ('FROM', 'WHERE', r'GROUP\s+BY', r'ORDER\s+BY', 'HAVING', 'LIMIT', 'UNION')
+_QUOTES = frozenset('\'"`')
+
+# 仅转换ASCII字母的大写表，保证扫描时下标与原SQL一致
+_ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+# 预编译正则
+_RE_COMMENT_TOKEN = re.compile(r'--|/\*|[\n\'"`]')
+_RE_DISTINCT = re.compile(r'\bDISTINCT\s+', re.IGNORECASE)
+_RE_AS = re.compile(r'\s+AS\s+([^\s,]+)$', re.IGNORECASE)
+_RE_FIELD_DELIMITER = re.compile(r'[,()]')
+# _scan 关注的记号：引号、注释起始、括号、SELECT及结束关键字（匹配大写后的SQL）
+# 关键字前不能是"."，t.from、x.limit 等限定名不视为关键字
+_RE_SCAN_TOKEN = re.compile(
+    r'[\'"`()]|--|/\*|\b(?<!\.)(?:SELECT|' + '|'.join(SELECT_TERMINATORS) + r')\b'
+)
+_RE_OPERATOR = re.compile(r'[(+\-*/=]')
+
+# 字段类型推断关键字，按类别分组；零宽前瞻使每个位置的关键字都能被匹配到
+_RE_TYPE_KEYWORDS = re.compile(
+    r'(?=(?:'
+    r'(?P<CODE>mode|code|币种代码)'
+    r'|(?P<DATE>date|日期)'
+    r'|(?P<DAY>day)'
+    r'|(?P<TIME>time|时间)'
+    r'|(?P<STRING>org|trcl|cust|stff|user|dept|name|_dscr|_rmrk|描述|备注|flag|^is_|标记)'
+    r'|(?P<DECIMAL>amt|amount|price|ocy|rcy|scy|elmn|crdt|totl|ocpt|金额|qty|quantity|cnt|count|数量)'
+    r'))'
+)
+_CURRENCY_TYPE_FIELDS = frozenset(('fcytp', 'scytp', 'cytp', 'currency_type'))
+
 
 class FieldInfo:
     """字段信息"""
@@ -57,6 +103,8 @@ class FieldInfo:
         self.name = name
         self.alias = alias
         self.comment = comment
+        # 小写字段名，供类型推断和主键选择复用
+        self.lname = sys.intern(name.lower())
 
 
 class TypeRule:
@@ -70,22 +118,14 @@ class TypeRule:
 
 def parse_sql_fields(sql: str) -> List[FieldInfo]:
     """解析SQL，提取字段信息"""
-    fields = []
     trimmed_sql = sql.strip()
 
-    # 策略1: 尝试解析标准 SELECT ... FROM
-    if 'SELECT' in trimmed_sql.upper():
-        result = try_parse_select_from(trimmed_sql)
-        if result:
-            return result
-
-    # 策略2: 解析 SELECT 后的字段列表（无FROM）
-    if 'SELECT' in trimmed_sql.upper():
-        result = try_parse_select_fields(trimmed_sql)
-        if result:
-            return result
+    # 策略1: 解析 SELECT ... FROM 或 SELECT 后的字段列表（无FROM）
+    result = try_parse_select(trimmed_sql)
+    if result:
+        return result
 
-    # 策略3: 解析纯字段列表
+    # 策略2: 解析纯字段列表
     result = try_parse_field_list(trimmed_sql)
     if result:
         return result
@@ -93,89 +133,77 @@ def parse_sql_fields(sql: str) -> List[FieldInfo]:
     raise ValueError('无法解析SQL，请确保输入的是有效的SELECT查询或字段列表')
 
 
-def try_parse_select_from(sql: str) -> Optional[List[FieldInfo]]:
-    """尝试解析标准 SELECT ... FROM 语句"""
-    # 找到FROM关键字（考虑括号）
-    paren_count = 0
-    select_start = -1
-    from_pos = -1
+def _scan(sql: str) -> Tuple[int, int, int]:
+    """单遍扫描SQL，定位SELECT及其后第一个同层级的结束关键字
 
-    # 查找SELECT
-    select_match = re.search(r'\bSELECT\b', sql, re.IGNORECASE)
-    if not select_match:
-        return None
-
-    select_start = select_match.end()
+    跳过字符串和注释，按括号层级匹配；只在相关记号之间跳转，不逐字符遍历。
+    返回 (select_start, select_end, end_pos)，未找到时对应位置为-1。
+    """
+    upper_sql = sql.translate(_ASCII_UPPER)
+    select_start = select_end = -1
+    select_depth = 0
+    paren_count = 0
+    pos = 0
 
-    # 查找FROM
-    for i in range(select_start, len(sql)):
-        char = sql[i]
+    while True:
+        match = _RE_SCAN_TOKEN.search(upper_sql, pos)
+        if not match:
+            break
 
-        if char == '(':
+        token = match.group()
+        pos = match.end()
+
+        # 字符串和注释整体跳过
+        if token in _QUOTES:
+            close = upper_sql.find(token, pos)
+            if close == -1:
+                break
+            pos = close + 1
+        elif token == '--':
+            close = upper_sql.find('\n', pos)
+            if close == -1:
+                break
+            pos = close + 1
+        elif token == '/*':
+            close = upper_sql.find('*/', pos)
+            if close == -1:
+                break
+            pos = close + 2
+        elif token == '(':
             paren_count += 1
-        elif char == ')':
+        elif token == ')':
             paren_count -= 1
-        elif paren_count == 0 and sql[i:i+4].upper() == 'FROM':
-            # 检查FROM是否是独立单词
-            if i + 4 >= len(sql) or sql[i+4].isspace():
-                if i == 0 or sql[i-1].isspace():
-                    from_pos = i
-                    break
-
-    if from_pos == -1:
-        return None
+        elif select_end == -1:
+            if token == 'SELECT':
+                select_start, select_end = match.start(), pos
+                select_depth = paren_count
+        elif token != 'SELECT' and paren_count == select_depth:
+            return select_start, select_end, match.start()
 
-    select_clause = sql[select_start:from_pos].strip()
-    return parse_select_clause(select_clause)
+    return select_start, select_end, -1
 
 
-def try_parse_select_fields(sql: str) -> Optional[List[FieldInfo]]:
-    """解析SELECT后无FROM的字段列表"""
-    select_match = re.search(r'\bSELECT\b', sql, re.IGNORECASE)
-    if not select_match:
+def try_parse_select(sql: str) -> Optional[List[FieldInfo]]:
+    """解析 SELECT 语句中 SELECT 与 FROM（或WHERE、GROUP BY等）之间的字段"""
+    select_start, select_end, end_pos = _scan(sql)
+    if select_start == -1:
         return None
 
-    select_start = select_match.end()
-    select_clause = sql[select_start:].strip()
-
-    # 移除WHERE, GROUP BY, ORDER BY等
-    stop_keywords = ['WHERE', 'GROUP BY', 'ORDER BY', 'HAVING', 'LIMIT', 'UNION']
-    for keyword in stop_keywords:
-        keyword_match = re.search(f'\\b{keyword}\\b', select_clause, re.IGNORECASE)
-        if keyword_match:
-            select_clause = select_clause[:keyword_match.start()].strip()
-            break
+    if end_pos == -1:
+        end_pos = len(sql)
 
+    select_clause = sql[select_end:end_pos].strip()
     return parse_select_clause(select_clause)
 
 
 def try_parse_field_list(sql: str) -> Optional[List[FieldInfo]]:
     """解析纯字段列表"""
     # 移除注释
-    clean_sql = re.sub(r'--.*$', '', sql, flags=re.MULTILINE)
-    clean_sql = re.sub(r'/\*.*?\*/', '', clean_sql, flags=re.DOTALL)
+    clean_sql, _ = strip_comments(sql)
     clean_sql = clean_sql.strip()
 
     # 按逗号分割（考虑括号）
-    field_expressions = []
-    current = []
-    paren_count = 0
-
-    for char in clean_sql:
-        if char == '(':
-            paren_count += 1
-            current.append(char)
-        elif char == ')':
-            paren_count -= 1
-            current.append(char)
-        elif char == ',' and paren_count == 0:
-            field_expressions.append(''.join(current).strip())
-            current = []
-        else:
-            current.append(char)
-
-    if current:
-        field_expressions.append(''.join(current).strip())
+    field_expressions = split_fields(clean_sql)
 
     # 解析每个字段
     fields = []
@@ -191,21 +219,8 @@ def parse_select_clause(select_clause: str) -> List[FieldInfo]:
     """解析SELECT子句"""
     fields = []
 
-    # 提取注释
-    comment_map = {}
-    lines = select_clause.split('\n')
-    for line in lines:
-        comment_match = re.search(r'--\s*(.+)$', line)
-        if comment_match:
-            comment = comment_match.group(1).strip()
-            field_part = line[:comment_match.start()].strip()
-            if field_part:
-                normalized_key = field_part.lstrip(',').strip()
-                comment_map[normalized_key] = comment
-
-    # 移除注释
-    clean_clause = re.sub(r'--.*$', '', select_clause, flags=re.MULTILINE)
-    clean_clause = re.sub(r'/\*.*?\*/', '', clean_clause, flags=re.DOTALL)
+    # 移除注释并提取行尾注释
+    clean_clause, comment_map = strip_comments(select_clause)
 
     # 分割字段
     field_expressions = split_fields(clean_clause)
@@ -218,27 +233,84 @@ def parse_select_clause(select_clause: str) -> List[FieldInfo]:
     return fields
 
 
+def strip_comments(sql: str) -> Tuple[str, Dict[str, str]]:
+    """单遍扫描移除注释，同时提取行尾注释
+
+    返回 (去除注释后的SQL, {注释所在行的字段文本: 注释内容})。
+    字符串中的注释符号按普通字符处理。
+    """
+    clean_parts = []
+    line_parts = []
+    comment_map = {}
+    length = len(sql)
+    pos = 0
+
+    while pos < length:
+        match = _RE_COMMENT_TOKEN.search(sql, pos)
+        if not match:
+            line_parts.append(sql[pos:])
+            break
+
+        token = match.group()
+        start = match.start()
+        line_parts.append(sql[pos:start])
+
+        if token == '\n':
+            clean_parts.extend(line_parts)
+            clean_parts.append(token)
+            line_parts = []
+            pos = match.end()
+        elif token == '--':
+            # 行注释，记录为本行字段的注释
+            end = sql.find('\n', start)
+            if end == -1:
+                end = length
+            field_part = ''.join(line_parts).strip()
+            if field_part and end > start + 2:
+                comment_map[field_part.lstrip(',').strip()] = sql[start + 2:end].strip()
+            pos = end
+        elif token == '/*':
+            end = sql.find('*/', start + 2)
+            if end == -1:
+                line_parts.append(token)
+                pos = match.end()
+            else:
+                pos = end + 2
+        else:
+            # 字符串原样保留
+            end = sql.find(token, start + 1)
+            pos = length if end == -1 else end + 1
+            line_parts.append(sql[start:pos])
+
+    clean_parts.extend(line_parts)
+    return ''.join(clean_parts), comment_map
+
+
 def split_fields(select_clause: str) -> List[str]:
     """分割字段（考虑括号）"""
+    # 无括号时直接按逗号分割
+    if '(' not in select_clause and ')' not in select_clause:
+        parts = select_clause.split(',')
+        if not parts[-1]:
+            parts.pop()
+        return [part.strip() for part in parts]
+
     field_expressions = []
-    current = []
+    start = 0
     paren_count = 0
 
-    for char in select_clause:
+    for match in _RE_FIELD_DELIMITER.finditer(select_clause):
+        char = match.group()
         if char == '(':
             paren_count += 1
-            current.append(char)
         elif char == ')':
             paren_count -= 1
-            current.append(char)
-        elif char == ',' and paren_count == 0:
-            field_expressions.append(''.join(current).strip())
-            current = []
-        else:
-            current.append(char)
+        elif paren_count == 0:
+            field_expressions.append(select_clause[start:match.start()].strip())
+            start = match.end()
 
-    if current:
-        field_expressions.append(''.join(current).strip())
+    if start < len(select_clause):
+        field_expressions.append(select_clause[start:].strip())
 
     return field_expressions
 
@@ -248,17 +320,18 @@ def parse_field_expression(expr: str, comment_map: Optional[Dict[str, str]] = No
     expr = expr.strip()
 
     # 跳过子查询
-    if 'SELECT' in expr.upper() or ' FROM ' in expr.upper():
+    upper_expr = expr.upper()
+    if 'SELECT' in upper_expr or ' FROM ' in upper_expr:
         return None
 
     if comment_map is None:
         comment_map = {}
 
     # 移除DISTINCT
-    expr = re.sub(r'\bDISTINCT\s+', '', expr, flags=re.IGNORECASE)
+    expr = _RE_DISTINCT.sub('', expr)
 
     # 查找AS别名
-    alias_match = re.search(r'\s+AS\s+([^\s,]+)$', expr, re.IGNORECASE)
+    alias_match = _RE_AS.search(expr)
     if alias_match:
         main_expr = expr[:alias_match.start()].strip()
         alias = alias_match.group(1).strip("'\"")
@@ -269,7 +342,7 @@ def parse_field_expression(expr: str, comment_map: Optional[Dict[str, str]] = No
         if len(parts) > 1:
             # 检查是否是简单别名
             last_part = parts[-1].strip("'\"")
-            if not any(op in parts[-2] for op in ['(', '+', '-', '*', '/', '=']):
+            if not _RE_OPERATOR.search(parts[-2]):
                 name = ' '.join(parts[:-1])
                 alias = last_part
             else:
@@ -288,63 +361,67 @@ def parse_field_expression(expr: str, comment_map: Optional[Dict[str, str]] = No
     return FieldInfo(name=field_name, alias=alias, comment=comment)
 
 
+def compile_type_rules(custom_rules: Optional[List[TypeRule]]) -> List[Tuple[str, str]]:
+    """将自定义规则按优先级排序，展开为 (小写关键字, 数据类型) 列表"""
+    if not custom_rules:
+        return []
+
+    return [
+        (keyword.lower(), rule.data_type)
+        for rule in sorted(custom_rules, key=lambda x: x.priority)
+        for keyword in rule.keywords
+    ]
+
+
 def infer_field_type(field_name: str, custom_rules: Optional[List[TypeRule]] = None) -> str:
     """推断字段类型"""
-    name = field_name.lower()
+    return _infer_type(field_name.lower(), compile_type_rules(custom_rules))
+
 
+def _infer_type(name: str, custom_rules: Optional[List[Tuple[str, str]]] = None) -> str:
+    """按小写字段名推断字段类型（custom_rules为compile_type_rules的结果）"""
     # 自定义规则
     if custom_rules:
-        sorted_rules = sorted(custom_rules, key=lambda x: x.priority)
-        for rule in sorted_rules:
-            for keyword in rule.keywords:
-                if name == keyword.lower() or keyword.lower() in name:
-                    return rule.data_type
+        for keyword, data_type in custom_rules:
+            if keyword in name:
+                return data_type
+
+    return _infer_default_type(name)
 
-    # 默认规则
+
+@lru_cache(maxsize=4096)
+def _infer_default_type(name: str) -> str:
+    """按默认规则推断字段类型（name为小写字段名）"""
     # 币种代码
-    if name in ['fcytp', 'scytp', 'cytp', 'currency_type'] or '币种代码' in name:
+    if name in _CURRENCY_TYPE_FIELDS:
         return 'STRING'
 
-    # 模式、代码
-    if 'mode' in name or 'code' in name or 'icode' in name:
+    matched = {match.lastgroup for match in _RE_TYPE_KEYWORDS.finditer(name)}
+
+    # 模式、代码、币种代码
+    if 'CODE' in matched:
         return 'STRING'
 
     # 日期
-    if 'date' in name or '日期' in name:
-        if 'day' not in name and 'days' not in name:
-            return 'DATE'
+    if 'DATE' in matched and 'DAY' not in matched:
+        return 'DATE'
 
     # 时间
-    if 'time' in name or 'timestamp' in name or '时间' in name:
+    if 'TIME' in matched:
         return 'TIMESTAMP'
 
-    # 组织、客户、人员
-    if any(k in name for k in ['org', 'trcl', 'cust', 'stff', 'user', 'dept']):
+    # 组织、客户、人员、名称、标记
+    if 'STRING' in matched:
         return 'STRING'
 
-    # 名称
-    if any(k in name for k in ['_name', '_dscr', '_rmrk', 'name', '描述', '备注']):
-        return 'STRING'
-
-    # 标记
-    if 'flag' in name or name.startswith('is_') or '标记' in name:
-        return 'STRING'
-
-    # 天数
-    if 'days' in name or ('day' in name and name != 'weekday'):
-        return 'DECIMAL(24, 6)'
-
-    # 金额
-    if any(k in name for k in ['amt', 'amount', 'price', 'ocy', 'rcy', 'scy', 'elmn', 'crdt', 'totl', 'ocpt', '金额']):
-        return 'DECIMAL(24, 6)'
-
-    # 数量
-    if any(k in name for k in ['qty', 'quantity', 'cnt', 'count', '数量']):
+    # 天数、金额、数量
+    if ('DAY' in matched and name != 'weekday') or 'DECIMAL' in matched:
         return 'DECIMAL(24, 6)'
 
     return 'STRING'
 
 
+@lru_cache(maxsize=512)
 def map_data_type_for_database(data_type: str, database_type: str) -> str:
     """将通用类型映射到特定数据库"""
     if database_type == 'clickhouse':
@@ -371,64 +448,62 @@ def select_primary_key(fields: List[FieldInfo]) -> Optional[str]:
     if not fields:
         return None
 
-    # 规则1: 优先选择后缀为icode的字段
-    icode_field = next((f for f in fields if f.name.lower().endswith('icode')), None)
-    if icode_field:
-        return icode_field.name
+    id_field: Optional[str] = None
+    for field in fields:
+        # 规则1: 优先选择后缀为icode的字段
+        if field.lname.endswith('icode'):
+            return field.name
 
-    # 规则2: 选择后缀为id的字段（非icode）
-    id_field = next(
-        (f for f in fields if f.name.lower().endswith('id') and not f.name.lower().endswith('icode')),
-        None
-    )
-    if id_field:
-        return id_field.name
+        # 规则2: 记录第一个后缀为id的字段
+        if id_field is None and field.lname.endswith('id'):
+            id_field = field.name
 
-    # 规则3: 选择第一个字段
-    return fields[0].name
+    # 规则3: 没有id字段时选择第一个字段
+    return id_field or fields[0].name
 
 
-def generate_ddl(
+def _prepare_fields(fields: List[FieldInfo]) -> List[Dict[str, str]]:
+    """预处理与数据库类型无关的字段信息（对齐后的字段名、转义后的注释）"""
+    max_name_length = max((len(f.name) for f in fields), default=0) or 30
+
+    return [
+        {
+            'name': field.name,
+            'padded_name': field.name.ljust(max_name_length),
+            'comment': _escape_sql_string(field.comment),
+        }
+        for field in fields
+    ]
+
+
+def _escape_sql_string(text: str) -> str:
+    """转义SQL字符串中的单引号"""
+    if "'" not in text:
+        return text
+    return text.replace("'", "''")
+
+
+def _render_ddl(
     fields: List[FieldInfo],
-    custom_rules: Optional[Dict[str, List[TypeRule]]] = None,
-    database_type: str = 'spark'
+    prepared_fields: List[Dict[str, str]],
+    field_types: List[str],
+    database_type: str
 ) -> str:
-    """生成DDL语句"""
-    if custom_rules is None:
-        custom_rules = {}
-
+    """根据预处理的字段信息和通用类型生成指定数据库的DDL"""
     config = DATABASE_CONFIGS.get(database_type, DATABASE_CONFIGS['spark'])
-
-    # 计算对齐宽度
-    max_name_length = max((len(f.name) for f in fields), default=0) or 30
     max_type_length = 18
 
-    # 获取自定义规则
-    db_rules = custom_rules.get(database_type, [])
-
     # 调整数据类型
-    adjusted_fields = []
-    for field in fields:
-        field_type = infer_field_type(field.name, db_rules)
-        mapped_type = map_data_type_for_database(field_type, database_type)
-        adjusted_fields.append({
-            'name': field.name,
-            'type': mapped_type,
-            'comment': field.comment
-        })
+    mapped_types = [map_data_type_for_database(t, database_type) for t in field_types]
 
     # 生成DDL
     ddl_parts = [f"{config['create_table_prefix']} 表名 ("]
 
-    for idx, field in enumerate(adjusted_fields):
-        padded_name = field['name'].ljust(max_name_length)
-        padded_type = field['type'].ljust(max_type_length)
-        comment_text = f"COMMENT '{field['comment'].replace(\"'\", \"''\")}'"
-
-        if idx == 0:
-            ddl_parts.append(f"    {padded_name} {padded_type} {comment_text}")
-        else:
-            ddl_parts.append(f"   ,{padded_name} {padded_type} {comment_text}")
+    if prepared_fields:
+        ddl_parts.append("    " + "\n   ,".join(
+            f"{field['padded_name']} {field_type.ljust(max_type_length)} COMMENT '{field['comment']}'"
+            for field, field_type in zip(prepared_fields, mapped_types)
+        ))
 
     # 添加主键（MySQL）
     if config.get('add_primary_key'):
@@ -436,34 +511,66 @@ def generate_ddl(
         if primary_key:
             ddl_parts.append(f"   ,PRIMARY KEY ({primary_key})")
 
-    ddl_parts.append(")")
+    # 添加ENGINE和表注释
+    ddl_parts.append(")" + config['table_suffix'])
 
-    # 添加ENGINE和COMMENT
-    if config['comment_syntax'] == 'INLINE':
-        if config.get('add_engine'):
-            ddl_parts.append(" ENGINE=InnoDB")
-        ddl_parts.append(" COMMENT ''")
-    elif config['comment_syntax'] == 'SEPARATE':
-        ddl_parts.append(";")
-        ddl_parts.append("")
-        ddl_parts.append("COMMENT ON TABLE 表名 IS '';")
-        for field in adjusted_fields:
-            ddl_parts.append(f"COMMENT ON COLUMN 表名.{field['name']} IS '{field['comment'].replace(\"'\", \"''\")}';")
+    # 单独的字段注释语句（PostgreSQL）
+    if config['comment_syntax'] == 'SEPARATE':
+        ddl_parts.extend(
+            f"COMMENT ON COLUMN 表名.{field['name']} IS '{field['comment']}';"
+            for field in prepared_fields
+        )
 
     return '\n'.join(ddl_parts)
 
 
+def generate_ddl(
+    fields: List[FieldInfo],
+    custom_rules: Optional[Dict[str, List[TypeRule]]] = None,
+    database_type: str = 'spark'
+) -> str:
+    """生成DDL语句"""
+    if custom_rules is None:
+        custom_rules = {}
+
+    # 获取自定义规则
+    db_rules = compile_type_rules(custom_rules.get(database_type))
+    field_types = [_infer_type(field.lname, db_rules) for field in fields]
+
+    return _render_ddl(fields, _prepare_fields(fields), field_types, database_type)
+
+
 def generate_multiple_ddls(
     fields: List[FieldInfo],
     custom_rules: Dict[str, List[TypeRule]],
     database_types: List[str]
 ) -> Dict:
     """为多个数据库类型生成DDL"""
+    # 单个数据库直接生成，返回简单格式
+    if len(database_types) == 1:
+        db_type = database_types[0]
+        if db_type in DATABASE_CONFIGS:
+            return {'ddl': generate_ddl(fields, custom_rules, db_type)}
+        return {'ddls': []}
+
     ddls = []
 
+    # 字段名对齐、注释转义与数据库类型无关，只计算一次
+    prepared_fields = _prepare_fields(fields)
+    # 没有自定义规则的数据库共用同一份通用类型推断结果
+    default_types: Optional[List[str]] = None
+
     for db_type in database_types:
         if db_type in DATABASE_CONFIGS:
-            ddl = generate_ddl(fields, custom_rules, db_type)
+            db_rules = compile_type_rules(custom_rules.get(db_type))
+            if db_rules:
+                field_types = [_infer_type(field.lname, db_rules) for field in fields]
+            else:
+                if default_types is None:
+                    default_types = [_infer_type(field.lname) for field in fields]
+                field_types = default_types
+
+            ddl = _render_ddl(fields, prepared_fields, field_types, db_type)
             ddls.append({
                 'databaseType': db_type,
                 'label': DATABASE_LABELS.get(db_type, db_type.upper()),
@@ -4,13 +4,18 @@ SQL建表语句生成器 - FastAPI应用
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, List, Optional
-from ddl_generator import parse_sql_fields, generate_multiple_ddls, TypeRule
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import json
+import os
+from ddl_generator import parse_sql_fields, generate_multiple_ddls, TypeRule, SUPPORTED_DATABASES
 
-app = FastAPI(title="SQL建表语句生成器", version="1.0.0")
+app = FastAPI(title="SQL建表语句生成器", version="1.0.0", default_response_class=ORJSONResponse)
 
 # 添加CORS中间件
 app.add_middleware(
@@ -22,18 +27,41 @@ app.add_middleware(
 )
 
 
+# 类型映射规则
+class TypeRuleModel(BaseModel):
+    id: str
+    keywords: List[str]
+    data_type: str
+    priority: int
+
+
 # 请求模型
 class GenerateDDLRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     sql: str
-    rulesByDatabase: Optional[Dict[str, List[TypeRule]]] = {}
-    databaseTypes: Optional[List[str]] = ['spark']
+    rulesByDatabase: Dict[str, List[TypeRuleModel]] = Field(default_factory=dict)
+    databaseTypes: List[str] = Field(default_factory=lambda: ['spark'])
+
+
+# 主页内容在启动时读取一次
+INDEX_HTML = (Path(__file__).resolve().parent / "static" / "index.html").read_text(encoding="utf-8")
+
+
+# 响应缓存：相同请求生成的DDL相同，按LRU保留最近的结果
+RESPONSE_CACHE_SIZE = 256
+_response_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+
+
+def _request_cache_key(request: GenerateDDLRequest) -> bytes:
+    payload = json.dumps(request.model_dump(mode="json"), sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
 
 
 # 主页
 @app.get("/", response_class=HTMLResponse)
 async def root():
-    with open("static/index.html", "r", encoding="utf-8") as f:
-        return f.read()
+    return HTMLResponse(INDEX_HTML)
 
 
 # API路由
@@ -44,6 +72,12 @@ async def generate_ddl(request: GenerateDDLRequest):
         if not request.sql or not request.sql.strip():
             raise HTTPException(status_code=400, detail="请提供有效的SQL查询语句")
 
+        cache_key = _request_cache_key(request)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            _response_cache.move_to_end(cache_key)
+            return cached
+
         # 解析SQL字段
         fields = parse_sql_fields(request.sql)
 
@@ -51,22 +85,36 @@ async def generate_ddl(request: GenerateDDLRequest):
             raise HTTPException(status_code=400, detail="未能从SQL中解析出字段")
 
         # 验证数据库类型
-        valid_types = [db for db in request.databaseTypes if db in request.rulesByDatabase.keys() or db in ['spark', 'mysql', 'postgresql', 'starrocks', 'clickhouse', 'hive', 'doris']]
+        valid_types = [db for db in request.databaseTypes if db in request.rulesByDatabase or db in SUPPORTED_DATABASES]
 
         if not valid_types:
             raise HTTPException(status_code=400, detail="请提供至少一个有效的数据库类型")
 
+        # 转换为生成器使用的TypeRule
+        custom_rules = {
+            db: [TypeRule(**rule.model_dump()) for rule in rules]
+            for db, rules in request.rulesByDatabase.items()
+        }
+
         # 生成DDL
-        result = generate_multiple_ddls(fields, request.rulesByDatabase, valid_types)
+        result = generate_multiple_ddls(fields, custom_rules, valid_types)
+
+        _response_cache[cache_key] = result
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
 
         return result
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"生成建表语句失败: {str(e)}")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=5000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=5000,
+        workers=os.cpu_count() or 1,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+    )
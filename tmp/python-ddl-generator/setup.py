@@ -0,0 +1,16 @@
+"""
+可选：使用 mypyc 将 ddl_generator.py 编译为C扩展
+
+    pip install mypy
+    python setup.py build_ext --inplace
+
+编译生成的扩展模块与 ddl_generator.py 同名，import 时优先加载，main.py 无需修改。
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="python-ddl-generator",
+    ext_modules=mypycify(["ddl_generator.py"]),
+)
@@ -0,0 +1,82 @@
+"""
+ddl_generator SQL解析测试
+"""
+
+import random
+
+import pytest
+
+from ddl_generator import parse_sql_fields, split_fields, strip_comments
+
+
+def field_names(sql):
+    return [field.name for field in parse_sql_fields(sql)]
+
+
+def test_select_from():
+    assert field_names("SELECT org_id, b.name AS cust_name, x.amt total_amt FROM t") == [
+        "org_id", "cust_name", "total_amt",
+    ]
+
+
+def test_from_followed_by_paren():
+    assert field_names("SELECT a,\n b\nFROM(SELECT 1) t") == ["a", "b"]
+
+
+def test_qualified_keywords_are_not_terminators():
+    assert field_names("SELECT x.limit FROM t") == ["x.limit"]
+    assert field_names("SELECT t.from, t.where, t.order_no FROM t") == ["t.from", "t.where", "t.order_no"]
+
+
+def test_select_without_from_stops_at_keyword():
+    assert field_names("SELECT a, b WHERE a = 1") == ["a", "b"]
+    assert field_names("SELECT a, b GROUP  BY a") == ["a", "b"]
+    assert field_names("SELECT a, b order\n by a") == ["a", "b"]
+
+
+def test_empty_select_raises():
+    with pytest.raises(ValueError):
+        parse_sql_fields("SELECT  FROM t")
+
+
+def test_line_comment_becomes_field_comment():
+    fields = parse_sql_fields("SELECT\n  org_id -- 组织\n  ,cust_name /* x */ -- 客户\nFROM t")
+    assert [(f.name, f.comment) for f in fields] == [("org_id", "组织"), ("cust_name", "客户")]
+
+
+def test_comment_markers_inside_strings_are_kept():
+    assert field_names("SELECT 'a--b' AS x, c FROM t") == ["x", "c"]
+
+    clean, comment_map = strip_comments("e '--q' f -- 注\n, '/* y */' g")
+    assert clean == "e '--q' f \n, '/* y */' g"
+    assert comment_map == {"e '--q' f": "注"}
+
+
+def test_field_list_without_select():
+    assert field_names("id\n,name -- 名字\n,coalesce(a, b) c") == ["id", "name", "c"]
+
+
+def _split_fields_reference(clause):
+    expressions = []
+    current = []
+    paren_count = 0
+    for char in clause:
+        if char == '(':
+            paren_count += 1
+        elif char == ')':
+            paren_count -= 1
+        elif char == ',' and paren_count == 0:
+            expressions.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    if current:
+        expressions.append(''.join(current).strip())
+    return expressions
+
+
+def test_split_fields_matches_character_loop():
+    rng = random.Random(0)
+    for _ in range(5000):
+        clause = ''.join(rng.choice('ab ,()\n') for _ in range(rng.randint(0, 12)))
+        assert split_fields(clause) == _split_fields_reference(clause)
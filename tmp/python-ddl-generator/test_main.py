@@ -0,0 +1,43 @@
+"""
+/api/generate-ddl 接口测试
+"""
+
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def test_repeated_request_hits_cache():
+    main._response_cache.clear()
+    payload = {"sql": "SELECT org_id, credit_amt FROM t", "databaseTypes": ["mysql"]}
+
+    first = client.post("/api/generate-ddl", json=payload)
+    assert first.status_code == 200
+    assert len(main._response_cache) == 1
+
+    second = client.post("/api/generate-ddl", json=payload)
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert len(main._response_cache) == 1
+
+
+def test_custom_rules_are_applied():
+    main._response_cache.clear()
+    payload = {
+        "sql": "SELECT org_id, credit_amt FROM t",
+        "rulesByDatabase": {
+            "spark": [{"id": "1", "keywords": ["AMT"], "data_type": "BIGINT", "priority": 1}],
+        },
+        "databaseTypes": ["spark"],
+    }
+
+    response = client.post("/api/generate-ddl", json=payload)
+    assert response.status_code == 200
+    assert "credit_amt BIGINT" in response.json()["ddl"]
+
+
+def test_null_database_types_rejected():
+    response = client.post("/api/generate-ddl", json={"sql": "SELECT a FROM t", "databaseTypes": None})
+    assert response.status_code == 422